@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import datetime
 import pytz
@@ -10,6 +11,17 @@ import random
 from datetime import datetime, timedelta
 import time
 import re
+import os
+import sys
+import io
+import json
+import copy
+import tempfile
+import threading
+import queue
+import http.client
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # Set page config
 st.set_page_config(
@@ -174,6 +186,109 @@ def parse_price(price_str):
     except:
         return 0
 
+# Vectorized column parsers
+# Values in the usual Kaggle formats are converted in bulk; everything else goes through
+# the scalar parser above, so results match it value for value and in dtype.
+INSTALLS_PATTERN = r'[0-9]{1,3}(?:,[0-9]{3}){0,5}\+?|[0-9]{1,18}\+?'
+SIZE_PATTERN = r'[0-9]{1,15}(?:\.[0-9]{1,15})?[MmKk]?'
+SIZE_VARIES = 'Varies with device'
+PRICE_PATTERN = r'\$?[0-9]{1,15}(?:\.[0-9]{1,15})?'
+
+def _match_fast_path(values, pattern):
+    """Boolean array marking string values that fully match a parser's fast-path pattern"""
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind == 'empty':
+        return np.zeros(len(values), dtype=bool)
+    if kind == 'string':
+        return values.str.fullmatch(pattern).fillna(False).to_numpy(dtype=bool)
+    
+    # Mixed column: only genuine strings take the fast path
+    is_str = values.map(type) == str
+    matches = values.where(is_str, '').astype(str).str.fullmatch(pattern).fillna(False)
+    return (is_str & matches).to_numpy(dtype=bool)
+
+# Below this many rows the bulk price parser's fixed overhead outweighs its per-row savings,
+# because the scalar parser handles free apps ('0') almost for free
+PRICE_BULK_MIN_ROWS = 3000
+
+def _to_numbers(strings, dtype):
+    """Convert numeric strings through numpy, which uses Python's int()/float() like the scalar parsers"""
+    # Much faster than Series.astype for string columns
+    return strings.to_numpy(dtype=object).astype(dtype)
+
+def _equals_mask(values, constant):
+    """Boolean array marking values equal to a constant string; missing values never match"""
+    return (values == constant).fillna(False).to_numpy(dtype=bool)
+
+def parse_installs_series(values):
+    """Vectorized parse_installs for a whole column"""
+    fast = _match_fast_path(values, INSTALLS_PATTERN)
+    if not fast.any():
+        return values.apply(parse_installs)
+    
+    result = np.zeros(len(values), dtype='int64')
+    digits = values[fast].astype(str).str.replace(',', '', regex=False).str.rstrip('+')
+    result[fast] = _to_numbers(digits, 'int64')
+    
+    if not fast.all():
+        fallback = values[~fast].apply(parse_installs)
+        if fallback.dtype != 'int64':
+            # Integers beyond int64 only fit in the scalar parser's Python ints
+            return values.apply(parse_installs)
+        result[~fast] = fallback.to_numpy()
+    return pd.Series(result, index=values.index, name=values.name)
+
+def parse_size_series(values):
+    """Vectorized parse_size for a whole column"""
+    fast = _match_fast_path(values, SIZE_PATTERN)
+    if not fast.any():
+        # Without a float from the fast path the scalar parser's result dtype depends on the fallbacks
+        return values.apply(parse_size)
+    
+    result = np.zeros(len(values), dtype='float64')
+    sizes = values[fast].astype(str)
+    in_kb = sizes.str.endswith(('k', 'K')).to_numpy(dtype=bool)
+    numbers = _to_numbers(sizes.str.rstrip('MmKk'), 'float64')
+    result[fast] = np.where(in_kb, numbers / 1024, numbers)
+    
+    # The most common unparseable size; the scalar parser maps it to 0
+    fallback = ~(fast | _equals_mask(values, SIZE_VARIES))
+    if fallback.any():
+        result[fallback] = values[fallback].apply(parse_size).to_numpy()
+    return pd.Series(result, index=values.index, name=values.name)
+
+def parse_price_series(values):
+    """Vectorized parse_price for a whole column"""
+    # Free apps are most of the column; the scalar parser maps '0' to 0 without parsing it
+    priced = ~_equals_mask(values, '0')
+    others = values[priced]
+    fast = _match_fast_path(others, PRICE_PATTERN)
+    if not fast.any():
+        return values.apply(parse_price)
+    
+    parsed = np.zeros(len(others), dtype='float64')
+    parsed[fast] = _to_numbers(others[fast].astype(str).str.lstrip('$'), 'float64')
+    if not fast.all():
+        parsed[~fast] = others[~fast].apply(parse_price).to_numpy()
+    
+    result = np.zeros(len(values), dtype='float64')
+    result[priced] = parsed
+    return pd.Series(result, index=values.index, name=values.name)
+
+# Chart visibility windows (IST hours)
+TIME_RANGES = {
+    'chart1': {'start': 15, 'end': 17, 'name': 'Chart 1 (Grouped Bar)', 'time': '3PM-5PM'},
+    'chart2': {'start': 18, 'end': 20, 'name': 'Chart 2 (Category Map)', 'time': '6PM-8PM'},
+    'chart3': {'start': 13, 'end': 14, 'name': 'Chart 3 (Dual-Axis)', 'time': '1PM-2PM'},
+    'chart4': {'start': 18, 'end': 21, 'name': 'Chart 4 (Time Series)', 'time': '6PM-9PM'},
+    'chart5': {'start': 17, 'end': 19, 'name': 'Chart 5 (Bubble Chart)', 'time': '5PM-7PM'},
+    'chart6': {'start': 16, 'end': 18, 'name': 'Chart 6 (Stacked Area)', 'time': '4PM-6PM'}
+}
+
+def get_active_chart_keys():
+    """Get the keys of charts whose time window includes the current IST time"""
+    return [key for key, info in TIME_RANGES.items() if is_time_in_range(info['start'], info['end'])]
+
 # Data filtering functions
 def filter_chart1_data(data):
     """Filter data for Chart 1: rating >= 4.0, size >= 10MB, updated in 2018"""
@@ -250,12 +365,11 @@ def filter_chart6_data(data):
     except:
         return data.head(0)
 
-# Chart creation functions
-def create_chart1_grouped_bar(data):
-    """Chart 1: Grouped Bar Chart (3PM-5PM IST)"""
+# Chart aggregation functions
+def aggregate_chart1_data(data):
+    """Aggregate data for Chart 1: top 10 categories by installs, or None if nothing passes the filters"""
     filtered_data = filter_chart1_data(data)
     if filtered_data.empty:
-        st.warning("⚠️ No data available after applying filters for Chart 1.")
         return None
     
     # Group by category and calculate stats
@@ -269,37 +383,12 @@ def create_chart1_grouped_bar(data):
     grouped['Category'] = grouped['Category'].apply(translate_categories)
     
     # Get top 10 by installs
-    top_10 = grouped.nlargest(10, 'installs_numeric')
-    
-    # Create dual-axis chart
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-    
-    fig.add_trace(
-        go.Bar(x=top_10['Category'], y=top_10['rating'], name="Avg Rating", marker_color='#8884d8'),
-        secondary_y=False,
-    )
-    
-    fig.add_trace(
-        go.Bar(x=top_10['Category'], y=top_10['Reviews'], name="Total Reviews", marker_color='#82ca9d'),
-        secondary_y=True,
-    )
-    
-    fig.update_xaxes(title_text="Categories")
-    fig.update_yaxes(title_text="Average Rating", secondary_y=False)
-    fig.update_yaxes(title_text="Total Reviews", secondary_y=True)
-    
-    fig.update_layout(
-        title="Chart 1: Top 10 Categories - Average Rating vs Total Reviews (3PM-5PM IST)",
-        height=500
-    )
-    
-    return fig
+    return grouped.nlargest(10, 'installs_numeric')
 
-def create_chart2_category_map(data):
-    """Chart 2: Category visualization (6PM-8PM IST)"""
+def aggregate_chart2_data(data):
+    """Aggregate data for Chart 2: top 5 categories by installs, or None if nothing passes the filters"""
     filtered_data = filter_chart2_data(data)
     if filtered_data.empty:
-        st.warning("⚠️ No data available after applying filters for Chart 2.")
         return None
     
     # Group by category
@@ -312,29 +401,12 @@ def create_chart2_category_map(data):
     grouped['Category'] = grouped['Category'].apply(translate_categories)
     
     # Get top 5
-    top_5 = grouped.nlargest(5, 'installs_numeric')
-    
-    # Create bar chart with color coding
-    colors = ['#ff6b6b' if x > 1000000 else '#4ecdc4' for x in top_5['installs_numeric']]
-    
-    fig = go.Figure(data=[
-        go.Bar(x=top_5['Category'], y=top_5['installs_numeric'], marker_color=colors, name="Total Installs")
-    ])
-    
-    fig.update_layout(
-        title="Chart 2: Top 5 Categories by Installs (Filtered) (6PM-8PM IST)",
-        xaxis_title="Categories",
-        yaxis_title="Total Installs",
-        height=500
-    )
-    
-    return fig
+    return grouped.nlargest(5, 'installs_numeric')
 
-def create_chart3_dual_axis(data):
-    """Chart 3: Dual-axis chart (1PM-2PM IST)"""
+def aggregate_chart3_data(data):
+    """Aggregate data for Chart 3: first 3 free and paid categories, or None if nothing passes the filters"""
     filtered_data = filter_chart3_data(data)
     if filtered_data.empty:
-        st.warning("⚠️ No data available after applying filters for Chart 3.")
         return None
     
     # Separate free and paid apps
@@ -349,49 +421,15 @@ def create_chart3_dual_axis(data):
     free_grouped['Category'] = free_grouped['Category'].apply(translate_categories)
     paid_grouped['Category'] = paid_grouped['Category'].apply(translate_categories)
     
-    # Create dual-axis chart
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-    
-    if not free_grouped.empty:
-        top_free = free_grouped.head(3)
-        fig.add_trace(
-            go.Bar(x=top_free['Category'], y=top_free['installs_numeric'], name="Free Apps Installs", marker_color='#8884d8'),
-            secondary_y=False,
-        )
-        
-        fig.add_trace(
-            go.Bar(x=top_free['Category'], y=top_free['Reviews'], name="Free Apps Reviews", marker_color='#ffc658'),
-            secondary_y=True,
-        )
-    
-    if not paid_grouped.empty:
-        top_paid = paid_grouped.head(3)
-        fig.add_trace(
-            go.Bar(x=top_paid['Category'], y=top_paid['installs_numeric'], name="Paid Apps Installs", marker_color='#82ca9d'),
-            secondary_y=False,
-        )
-        
-        fig.add_trace(
-            go.Bar(x=top_paid['Category'], y=top_paid['Reviews'], name="Paid Apps Reviews", marker_color='#ff7c7c'),
-            secondary_y=True,
-        )
-    
-    fig.update_xaxes(title_text="Categories")
-    fig.update_yaxes(title_text="Average Installs", secondary_y=False)
-    fig.update_yaxes(title_text="Average Reviews", secondary_y=True)
-    
-    fig.update_layout(
-        title="Chart 3: Free vs Paid Apps - Top 3 Categories (1PM-2PM IST)",
-        height=500
-    )
-    
-    return fig
+    # Stack the top 3 of each type into one frame
+    top_free = free_grouped.head(3).assign(Type='Free')
+    top_paid = paid_grouped.head(3).assign(Type='Paid')
+    return pd.concat([top_free, top_paid], ignore_index=True)
 
-def create_chart4_time_series(data):
-    """Chart 4: Time Series Line Chart (6PM-9PM IST)"""
+def aggregate_chart4_data(data):
+    """Aggregate data for Chart 4: monthly installs per category, or None if nothing passes the filters"""
     filtered_data = filter_chart4_data(data)
     if filtered_data.empty:
-        st.warning("⚠️ No data available after applying filters for Chart 4.")
         return None
     
     # Group by month and category
@@ -402,35 +440,12 @@ def create_chart4_time_series(data):
     grouped['Category'] = grouped['Category'].apply(translate_categories)
     
     # Pivot for plotting
-    pivot_data = grouped.pivot(index='month', columns='Category', values='installs_numeric').fillna(0)
-    
-    fig = go.Figure()
-    
-    colors = ['#8884d8', '#82ca9d', '#ffc658', '#ff7c7c', '#8dd1e1']
-    
-    for i, category in enumerate(pivot_data.columns):
-        fig.add_trace(go.Scatter(
-            x=pivot_data.index,
-            y=pivot_data[category],
-            mode='lines',
-            name=category,
-            line=dict(color=colors[i % len(colors)])
-        ))
-    
-    fig.update_layout(
-        title="Chart 4: Time Series - Installs by Category (6PM-9PM IST)",
-        xaxis_title="Month",
-        yaxis_title="Installs",
-        height=500
-    )
-    
-    return fig
+    return grouped.pivot(index='month', columns='Category', values='installs_numeric').fillna(0)
 
-def create_chart5_bubble_chart(data):
-    """Chart 5: Bubble Chart (5PM-7PM IST)"""
+def aggregate_chart5_data(data):
+    """Aggregate data for Chart 5: first 100 matching apps, or None if nothing passes the filters"""
     filtered_data = filter_chart5_data(data)
     if filtered_data.empty:
-        st.warning("⚠️ No data available after applying filters for Chart 5.")
         return None
     
     # Apply translations
@@ -438,42 +453,12 @@ def create_chart5_bubble_chart(data):
     filtered_data['Category'] = filtered_data['Category'].apply(translate_categories)
     
     # Limit for performance
-    sample_data = filtered_data.head(100)
-    
-    # Create colors for Game category (Pink)
-    colors = ['#ff69b4' if cat == 'Games' else '#8884d8' for cat in sample_data['Category']]
-    
-    fig = go.Figure(data=go.Scatter(
-        x=sample_data['size_mb'],
-        y=sample_data['rating'],
-        mode='markers',
-        marker=dict(
-            size=sample_data['installs_numeric']/50000,  # Scale down for visibility
-            color=colors,
-            opacity=0.6,
-            line=dict(width=2, color='DarkSlateGrey')
-        ),
-        text=sample_data['App'],
-        hovertemplate='<b>%{text}</b><br>' +
-                      'Size: %{x} MB<br>' +
-                      'Rating: %{y}<br>' +
-                      'Installs: %{marker.size}<extra></extra>'
-    ))
-    
-    fig.update_layout(
-        title="Chart 5: Bubble Chart - Size vs Rating vs Installs (5PM-7PM IST)",
-        xaxis_title="Size (MB)",
-        yaxis_title="Rating",
-        height=500
-    )
-    
-    return fig
+    return filtered_data.head(100)[['App', 'Category', 'size_mb', 'rating', 'installs_numeric']]
 
-def create_chart6_stacked_area(data):
-    """Chart 6: Stacked Area Chart (4PM-6PM IST)"""
+def aggregate_chart6_data(data):
+    """Aggregate data for Chart 6: monthly installs per category, or None if nothing passes the filters"""
     filtered_data = filter_chart6_data(data)
     if filtered_data.empty:
-        st.warning("⚠️ No data available after applying filters for Chart 6.")
         return None
     
     # Group by month and category
@@ -484,73 +469,657 @@ def create_chart6_stacked_area(data):
     grouped['Category'] = grouped['Category'].apply(translate_categories)
     
     # Pivot for plotting
-    pivot_data = grouped.pivot(index='month', columns='Category', values='installs_numeric').fillna(0)
+    return grouped.pivot(index='month', columns='Category', values='installs_numeric').fillna(0)
+
+CHART_AGGREGATES = {
+    'chart1': aggregate_chart1_data,
+    'chart2': aggregate_chart2_data,
+    'chart3': aggregate_chart3_data,
+    'chart4': aggregate_chart4_data,
+    'chart5': aggregate_chart5_data,
+    'chart6': aggregate_chart6_data
+}
+
+def fetch_chart_aggregate(chart_key, data, aggregate_client=None):
+    """Get a chart's aggregate in-process, or from the aggregate service when a client is given
+
+    Returns None after showing a warning when there is nothing to plot or the service fails.
+    """
+    chart_label = chart_key.replace('chart', 'Chart ')
+    if aggregate_client is None:
+        aggregate = CHART_AGGREGATES[chart_key](data)
+    else:
+        try:
+            aggregate = aggregate_client.fetch(chart_key)
+        except AggregateServiceError as e:
+            st.warning(f"⚠️ Aggregate service error for {chart_label}: {str(e)}")
+            return None
+    
+    if aggregate is None:
+        st.warning(f"⚠️ No data available after applying filters for {chart_label}.")
+    return aggregate
+
+# Figure templates
+# Layout, axes and theme for each chart are built and validated once per process;
+# each render only validates and fills in the traces.
+CHART_LAYOUTS = {
+    'chart1': {
+        'title': "Chart 1: Top 10 Categories - Average Rating vs Total Reviews (3PM-5PM IST)",
+        'xaxis_title': "Categories", 'yaxis_title': "Average Rating", 'yaxis2_title': "Total Reviews"
+    },
+    'chart2': {
+        'title': "Chart 2: Top 5 Categories by Installs (Filtered) (6PM-8PM IST)",
+        'xaxis_title': "Categories", 'yaxis_title': "Total Installs"
+    },
+    'chart3': {
+        'title': "Chart 3: Free vs Paid Apps - Top 3 Categories (1PM-2PM IST)",
+        'xaxis_title': "Categories", 'yaxis_title': "Average Installs", 'yaxis2_title': "Average Reviews"
+    },
+    'chart4': {
+        'title': "Chart 4: Time Series - Installs by Category (6PM-9PM IST)",
+        'xaxis_title': "Month", 'yaxis_title': "Installs"
+    },
+    'chart5': {
+        'title': "Chart 5: Bubble Chart - Size vs Rating vs Installs (5PM-7PM IST)",
+        'xaxis_title': "Size (MB)", 'yaxis_title': "Rating"
+    },
+    'chart6': {
+        'title': "Chart 6: Stacked Area - Cumulative Installs (4PM-6PM IST)",
+        'xaxis_title': "Month", 'yaxis_title': "Cumulative Installs"
+    }
+}
+
+@st.cache_resource
+def get_chart_layout(chart_key):
+    """Validated layout for a chart as a plain dict, built once per process"""
+    spec = CHART_LAYOUTS[chart_key]
+    
+    if 'yaxis2_title' in spec:
+        # Dual-axis chart
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        fig.update_xaxes(title_text=spec['xaxis_title'])
+        fig.update_yaxes(title_text=spec['yaxis_title'], secondary_y=False)
+        fig.update_yaxes(title_text=spec['yaxis2_title'], secondary_y=True)
+        fig.update_layout(title=spec['title'], height=500)
+    else:
+        fig = go.Figure()
+        fig.update_layout(
+            title=spec['title'],
+            xaxis_title=spec['xaxis_title'],
+            yaxis_title=spec['yaxis_title'],
+            height=500
+        )
+    
+    return fig.layout.to_plotly_json()
+
+def fill_chart_template(chart_key, traces):
+    """Figure from a chart's prebuilt layout and trace dicts
+
+    Only the layout skips validation, since it was validated when built; add_traces validates the traces.
+    """
+    fig = go.Figure(layout=copy.deepcopy(get_chart_layout(chart_key)), _validate=False)
+    fig.add_traces(traces)
+    return fig
+
+def compact_array(values):
+    """Numeric values in the smallest dtype that holds them exactly, for smaller base64 typed arrays"""
+    arr = np.asarray(values)
+    if arr.dtype.kind in 'iu':
+        info = np.iinfo(np.int32)
+        if arr.size == 0 or (arr.min() >= info.min and arr.max() <= info.max):
+            return arr.astype(np.int32)
+    
+    if arr.dtype.kind in 'iuf':
+        compact = arr.astype(np.float32)
+        if np.array_equal(compact.astype(arr.dtype), arr, equal_nan=True):
+            return compact
+    
+    # Plotly writes 64-bit integers it can't fit in a typed array as plain JSON numbers
+    return arr
+
+def measure_figure_payload(fig):
+    """Size in bytes of the JSON spec sent to the browser for a figure"""
+    return len(pio.to_json(fig, validate=False))
+
+# Chart creation functions
+def create_chart1_grouped_bar(data, aggregate_client=None):
+    """Chart 1: Grouped Bar Chart (3PM-5PM IST)"""
+    top_10 = fetch_chart_aggregate('chart1', data, aggregate_client)
+    if top_10 is None:
+        return None
+    
+    categories = top_10['Category'].tolist()
+    fig = fill_chart_template('chart1', [
+        {'type': 'bar', 'x': categories, 'y': compact_array(top_10['rating']), 'name': "Avg Rating",
+         'marker': {'color': '#8884d8'}, 'xaxis': 'x', 'yaxis': 'y'},
+        {'type': 'bar', 'x': categories, 'y': compact_array(top_10['Reviews']), 'name': "Total Reviews",
+         'marker': {'color': '#82ca9d'}, 'xaxis': 'x', 'yaxis': 'y2'}
+    ])
+    
+    return fig
+
+def create_chart2_category_map(data, aggregate_client=None):
+    """Chart 2: Category visualization (6PM-8PM IST)"""
+    top_5 = fetch_chart_aggregate('chart2', data, aggregate_client)
+    if top_5 is None:
+        return None
+    
+    # Create bar chart with color coding
+    colors = ['#ff6b6b' if x > 1000000 else '#4ecdc4' for x in top_5['installs_numeric']]
+    
+    fig = fill_chart_template('chart2', [
+        {'type': 'bar', 'x': top_5['Category'].tolist(), 'y': compact_array(top_5['installs_numeric']),
+         'marker': {'color': colors}, 'name': "Total Installs"}
+    ])
+    
+    return fig
+
+def create_chart3_dual_axis(data, aggregate_client=None):
+    """Chart 3: Dual-axis chart (1PM-2PM IST)"""
+    top_categories = fetch_chart_aggregate('chart3', data, aggregate_client)
+    if top_categories is None:
+        return None
+    
+    traces = []
+    
+    top_free = top_categories[top_categories['Type'] == 'Free']
+    if not top_free.empty:
+        traces.append({'type': 'bar', 'x': top_free['Category'].tolist(), 'y': compact_array(top_free['installs_numeric']),
+                       'name': "Free Apps Installs", 'marker': {'color': '#8884d8'}, 'xaxis': 'x', 'yaxis': 'y'})
+        traces.append({'type': 'bar', 'x': top_free['Category'].tolist(), 'y': compact_array(top_free['Reviews']),
+                       'name': "Free Apps Reviews", 'marker': {'color': '#ffc658'}, 'xaxis': 'x', 'yaxis': 'y2'})
+    
+    top_paid = top_categories[top_categories['Type'] == 'Paid']
+    if not top_paid.empty:
+        traces.append({'type': 'bar', 'x': top_paid['Category'].tolist(), 'y': compact_array(top_paid['installs_numeric']),
+                       'name': "Paid Apps Installs", 'marker': {'color': '#82ca9d'}, 'xaxis': 'x', 'yaxis': 'y'})
+        traces.append({'type': 'bar', 'x': top_paid['Category'].tolist(), 'y': compact_array(top_paid['Reviews']),
+                       'name': "Paid Apps Reviews", 'marker': {'color': '#ff7c7c'}, 'xaxis': 'x', 'yaxis': 'y2'})
     
-    fig = go.Figure()
+    # Create dual-axis chart
+    fig = fill_chart_template('chart3', traces)
+    
+    return fig
+
+def create_chart4_time_series(data, aggregate_client=None):
+    """Chart 4: Time Series Line Chart (6PM-9PM IST)"""
+    pivot_data = fetch_chart_aggregate('chart4', data, aggregate_client)
+    if pivot_data is None:
+        return None
     
     colors = ['#8884d8', '#82ca9d', '#ffc658', '#ff7c7c', '#8dd1e1']
+    months = pivot_data.index.tolist()
     
-    for i, category in enumerate(pivot_data.columns):
-        fig.add_trace(go.Scatter(
-            x=pivot_data.index,
-            y=pivot_data[category],
-            mode='lines',
-            name=category,
-            stackgroup='one',
-            fill='tonexty' if i > 0 else 'tozeroy',
-            line=dict(color=colors[i % len(colors)])
-        ))
-    
-    fig.update_layout(
-        title="Chart 6: Stacked Area - Cumulative Installs (4PM-6PM IST)",
-        xaxis_title="Month",
-        yaxis_title="Cumulative Installs",
-        height=500
-    )
+    fig = fill_chart_template('chart4', [
+        {'type': 'scatter', 'x': months, 'y': compact_array(pivot_data[category]), 'mode': 'lines',
+         'name': category, 'line': {'color': colors[i % len(colors)]}}
+        for i, category in enumerate(pivot_data.columns)
+    ])
+    
+    return fig
+
+def create_chart5_bubble_chart(data, aggregate_client=None):
+    """Chart 5: Bubble Chart (5PM-7PM IST)"""
+    sample_data = fetch_chart_aggregate('chart5', data, aggregate_client)
+    if sample_data is None:
+        return None
+    
+    # Create colors for Game category (Pink)
+    colors = ['#ff69b4' if cat == 'Games' else '#8884d8' for cat in sample_data['Category']]
+    
+    fig = fill_chart_template('chart5', [{
+        'type': 'scatter',
+        'x': compact_array(sample_data['size_mb']),
+        'y': compact_array(sample_data['rating']),
+        'mode': 'markers',
+        'marker': {
+            'size': compact_array(sample_data['installs_numeric']/50000),  # Scale down for visibility
+            'color': colors,
+            'opacity': 0.6,
+            'line': {'width': 2, 'color': 'DarkSlateGrey'}
+        },
+        # Missing names go out as null (blank hover label), not the string 'nan'
+        'text': sample_data['App'].astype(object).where(sample_data['App'].notna(), None).to_numpy(),
+        'hovertemplate': '<b>%{text}</b><br>' +
+                         'Size: %{x} MB<br>' +
+                         'Rating: %{y}<br>' +
+                         'Installs: %{marker.size}<extra></extra>'
+    }])
+    
+    return fig
+
+def create_chart6_stacked_area(data, aggregate_client=None):
+    """Chart 6: Stacked Area Chart (4PM-6PM IST)"""
+    pivot_data = fetch_chart_aggregate('chart6', data, aggregate_client)
+    if pivot_data is None:
+        return None
+    
+    colors = ['#8884d8', '#82ca9d', '#ffc658', '#ff7c7c', '#8dd1e1']
+    months = pivot_data.index.tolist()
+    
+    fig = fill_chart_template('chart6', [
+        {'type': 'scatter', 'x': months, 'y': compact_array(pivot_data[category]), 'mode': 'lines',
+         'name': category, 'stackgroup': 'one', 'fill': 'tonexty' if i > 0 else 'tozeroy',
+         'line': {'color': colors[i % len(colors)]}}
+        for i, category in enumerate(pivot_data.columns)
+    ])
     
     return fig
 
+# CSV read planning
+# Raw columns each chart needs, including the ones its derived columns are parsed from
+CHART_COLUMNS = {
+    'chart1': ['Category', 'Rating', 'Reviews', 'Size', 'Installs', 'Last Updated'],
+    'chart2': ['Category', 'Rating', 'Installs'],
+    'chart3': ['App', 'Category', 'Reviews', 'Size', 'Installs', 'Type', 'Price', 'Content Rating'],
+    'chart4': ['App', 'Category', 'Reviews', 'Installs', 'Last Updated'],
+    'chart5': ['App', 'Category', 'Rating', 'Reviews', 'Size', 'Installs'],
+    'chart6': ['App', 'Category', 'Rating', 'Reviews', 'Size', 'Installs', 'Last Updated']
+}
+
+# Columns the sidebar and data preview always show
+BASE_COLUMNS = ['App', 'Category', 'Type']
+
+def get_available_csv_engine():
+    """Return the fastest CSV parser engine installed"""
+    try:
+        import pyarrow  # noqa: F401
+        return 'pyarrow'
+    except ImportError:
+        return 'c'
+
+def build_read_plan(chart_keys, header):
+    """Build read_csv arguments that only parse the columns the given charts need"""
+    needed = set(BASE_COLUMNS)
+    for key in chart_keys:
+        needed.update(CHART_COLUMNS[key])
+    
+    # Keep the file's column order and skip columns the file doesn't have
+    usecols = [col for col in header if col in needed]
+    
+    # Everything is parsed as text; numeric conversion happens with coercion afterwards
+    return {
+        'usecols': usecols,
+        'dtype': {col: str for col in usecols},
+        'engine': get_available_csv_engine()
+    }
+
+@st.cache_resource
+def get_csv_engine_memo():
+    """Engine that parsed each CSV path, keyed by (path, mtime), kept for the process across reruns
+
+    A file pyarrow rejects goes straight to the C engine on later reads instead of failing again first.
+    """
+    return {}
+
+def _csv_source_key(source):
+    """Key a CSV path by location and modification time; file-like sources aren't remembered"""
+    if isinstance(source, (str, os.PathLike)):
+        return (os.path.abspath(source), os.path.getmtime(source))
+    return None
+
+def read_app_csv(source, chart_keys):
+    """Read a Google Play Store CSV using a read plan for the given charts"""
+    header = list(pd.read_csv(source, nrows=0).columns)
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    
+    plan = build_read_plan(chart_keys, header)
+    engine_memo = get_csv_engine_memo()
+    source_key = _csv_source_key(source)
+    plan['engine'] = engine_memo.get(source_key, plan['engine'])
+    try:
+        df = pd.read_csv(source, **plan)
+    except (pd.errors.ParserError, ValueError):
+        # pyarrow rejects ragged rows (the Kaggle export has one); the C engine pads them
+        if plan['engine'] == 'c':
+            raise
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        plan['engine'] = 'c'
+        df = pd.read_csv(source, **plan)
+    
+    if source_key is not None:
+        engine_memo[source_key] = plan['engine']
+    return df
+
+def prepare_app_data(df, vectorized=True):
+    """Derive the numeric and date columns the dashboard expects
+
+    vectorized=False parses row by row with the scalar parsers; the regression harness uses it as the reference.
+    Prices are parsed in bulk only for frames of at least PRICE_BULK_MIN_ROWS rows.
+    """
+    if 'Rating' in df.columns:
+        df['rating'] = pd.to_numeric(df['Rating'], errors='coerce').fillna(0)
+    
+    if 'Reviews' in df.columns:
+        df['Reviews'] = pd.to_numeric(df['Reviews'], errors='coerce').fillna(0)
+    
+    if 'Size' in df.columns:
+        df['size_mb'] = parse_size_series(df['Size']) if vectorized else df['Size'].apply(parse_size)
+    
+    if 'Installs' in df.columns:
+        df['installs_numeric'] = parse_installs_series(df['Installs']) if vectorized else df['Installs'].apply(parse_installs)
+    
+    if 'Price' in df.columns:
+        bulk_price = vectorized and len(df) >= PRICE_BULK_MIN_ROWS
+        df['price_numeric'] = parse_price_series(df['Price']) if bulk_price else df['Price'].apply(parse_price)
+    
+    # Convert Last Updated to datetime
+    if 'Last Updated' in df.columns:
+        df['last_updated'] = pd.to_datetime(df['Last Updated'], errors='coerce')
+        # For apps without valid date, assign a random date in 2018
+        mask = df['last_updated'].isna()
+        df.loc[mask, 'last_updated'] = pd.date_range('2018-01-01', '2018-12-31', periods=mask.sum())
+    
+    return df
+
+# Dataset summary
+def summarize_app_data(df, preview_rows=5):
+    """Compute the summary statistics shown in the data preview, once per loaded dataset"""
+    summary = {
+        'shape': df.shape,
+        'total_apps': len(df),
+        'preview': df.head(preview_rows).copy(),
+        'null_counts': {col: int(count) for col, count in df.isna().sum().items()},
+        'memory_bytes': int(df.memory_usage(deep=True).sum()),
+        'category_count': None,
+        'type_counts': {}
+    }
+    
+    if 'Category' in df.columns:
+        summary['category_count'] = int(df['Category'].nunique())
+    
+    if 'Type' in df.columns:
+        summary['type_counts'] = {str(k): int(v) for k, v in df['Type'].value_counts().items()}
+    
+    return summary
+
+@st.cache_data
+def summarize_sample_data():
+    """Summary for the cached sample dataset"""
+    return summarize_app_data(generate_sample_data())
+
 # File upload function
-def load_csv_data(uploaded_file):
-    """Load and parse Google Play Store CSV data"""
+def load_csv_data(uploaded_file, chart_keys=None):
+    """Load and parse Google Play Store CSV data, reading only the columns the given charts need"""
+    if chart_keys is None:
+        chart_keys = list(CHART_COLUMNS)
+    
     try:
-        df = pd.read_csv(uploaded_file)
-        
-        # Ensure we have the expected columns for Google Play Store dataset
-        expected_columns = ['App', 'Category', 'Rating', 'Reviews', 'Size', 'Installs', 
-                          'Type', 'Price', 'Content Rating', 'Genres', 'Last Updated', 
-                          'Current Ver', 'Android Ver']
+        df = read_app_csv(uploaded_file, chart_keys)
         
         st.write(f"Loaded CSV with columns: {list(df.columns)}")
         
-        # Process data types to match what the dashboard expects
-        if 'Rating' in df.columns:
-            df['rating'] = pd.to_numeric(df['Rating'], errors='coerce').fillna(0)
+        return prepare_app_data(df)
         
-        if 'Reviews' in df.columns:
-            df['Reviews'] = pd.to_numeric(df['Reviews'], errors='coerce').fillna(0)
+    except Exception as e:
+        st.error(f"Error loading CSV file: {str(e)}")
+        return None
+
+# Cached ingest
+# Parsing and summarizing run once per file version and chart set; reruns reuse the result
+@st.cache_data(max_entries=4)
+def ingest_uploaded_csv(content, chart_keys):
+    """Load and summarize an uploaded CSV, keyed on its bytes and the active charts"""
+    app_data = load_csv_data(io.BytesIO(content), list(chart_keys))
+    if app_data is None:
+        return None, None
+    return app_data, summarize_app_data(app_data)
+
+@st.cache_data(max_entries=4)
+def ingest_local_csv(file_path, modified_at, chart_keys):
+    """Load and summarize a local CSV; modified_at keys the cache to each version of the file"""
+    app_data = prepare_app_data(read_app_csv(file_path, list(chart_keys)))
+    return app_data, summarize_app_data(app_data)
+
+def load_local_csv(file_path, chart_keys):
+    """Load a local CSV and its summary through the ingest cache"""
+    return ingest_local_csv(file_path, os.path.getmtime(file_path), tuple(chart_keys))
+
+# Shared dataset serving
+# One loader process publishes the normalized dataset as an Arrow IPC file in shared memory;
+# dashboard processes memory-map it instead of each parsing the CSV themselves.
+SHARED_DATASET_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+SHARED_DATASET_PATH = os.path.join(SHARED_DATASET_DIR, 'app_analytics_dataset.arrow')
+SHARED_SUMMARY_KEY = b'app_analytics_summary'
+
+def publish_shared_dataset(csv_path, shared_path=SHARED_DATASET_PATH):
+    """Load and normalize a CSV once and publish it as a memory-mappable Arrow IPC file"""
+    import pyarrow as pa
+    
+    df = prepare_app_data(read_app_csv(csv_path, list(CHART_COLUMNS)))
+    summary = summarize_app_data(df)
+    summary.pop('preview')
+    
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        SHARED_SUMMARY_KEY: json.dumps(summary).encode('utf-8')
+    })
+    
+    # Write next to the target and rename so attached readers never see a partial file
+    tmp_path = f"{shared_path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, shared_path)
+    
+    return summary
+
+def get_shared_string_dtype():
+    """Arrow-backed string dtype that treats missing values like the CSV loader's strings (NaN)
+
+    pandas 3 uses it as the default str dtype and pandas 2.1/2.2 offer it as "pyarrow_numpy";
+    pandas 1.5/2.0 have none, so None is returned and shared strings become copied object columns.
+    """
+    loader_string_dtype = pd.Series([''], dtype=str).dtype
+    if isinstance(loader_string_dtype, pd.StringDtype):
+        return loader_string_dtype
+    try:
+        return pd.StringDtype('pyarrow_numpy')
+    except (ValueError, TypeError):
+        return None
+
+def arrow_table_to_frame(table):
+    """Convert a shared Arrow table to pandas, keeping buffers as views over the mapping where possible"""
+    import pyarrow as pa
+    
+    string_dtype = get_shared_string_dtype()
+    return table.to_pandas(
+        split_blocks=True,
+        types_mapper={pa.string(): string_dtype, pa.large_string(): string_dtype}.get
+    )
+
+@st.cache_resource(max_entries=1)
+def attach_shared_dataset(shared_path, published_at):
+    """Memory-map a published dataset once per process; published_at keys the cache to each publish"""
+    import pyarrow as pa
+    
+    table = pa.ipc.open_file(pa.memory_map(shared_path, 'r')).read_all()
+    df = arrow_table_to_frame(table)
+    
+    summary = json.loads(table.schema.metadata[SHARED_SUMMARY_KEY])
+    summary['shape'] = tuple(summary['shape'])
+    summary['preview'] = df.head()
+    
+    return df, summary
+
+def load_shared_dataset(shared_path=SHARED_DATASET_PATH):
+    """Attach to the dataset published by the loader process"""
+    return attach_shared_dataset(shared_path, os.path.getmtime(shared_path))
+
+# Aggregate service
+# A dedicated process holds the dataset and computes chart aggregates for every dashboard
+# session; dashboards fetch them over localhost HTTP through a pooled client.
+AGGREGATE_SERVICE_HOST = '127.0.0.1'
+AGGREGATE_SERVICE_PORT = 8765
+
+def encode_aggregate(aggregate):
+    """Serialize a chart aggregate as an Arrow IPC stream; None (no data) becomes an empty payload"""
+    import pyarrow as pa
+    
+    if aggregate is None:
+        return b''
+    table = pa.Table.from_pandas(aggregate)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def decode_aggregate(payload):
+    """Inverse of encode_aggregate"""
+    import pyarrow as pa
+    
+    if not payload:
+        return None
+    return pa.ipc.open_stream(payload).read_all().to_pandas()
+
+class AggregateService:
+    """Holds one dataset and serves encoded chart aggregates, computing each at most once"""
+    
+    def __init__(self, data, dataset_key):
+        self.data = data
+        self.dataset_key = dataset_key
+        self.summary = summarize_app_data(data)
+        self.summary.pop('preview')
+        self._results = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+    
+    def get(self, chart_key):
+        """Encoded aggregate for a chart; concurrent requests for the same key share one computation"""
+        key = (chart_key, self.dataset_key)
+        with self._lock:
+            if key in self._results:
+                return self._results[key]
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = Future()
+                is_owner = True
+            else:
+                is_owner = False
         
-        if 'Size' in df.columns:
-            df['size_mb'] = df['Size'].apply(parse_size)
+        if not is_owner:
+            return pending.result()
         
-        if 'Installs' in df.columns:
-            df['installs_numeric'] = df['Installs'].apply(parse_installs)
+        try:
+            payload = encode_aggregate(CHART_AGGREGATES[chart_key](self.data))
+        except Exception as e:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(e)
+            raise
         
-        if 'Price' in df.columns:
-            df['price_numeric'] = df['Price'].apply(parse_price)
+        with self._lock:
+            self._results[key] = payload
+            del self._pending[key]
+        pending.set_result(payload)
+        return payload
+
+def make_aggregate_handler(service):
+    """Build the HTTP request handler class bound to an AggregateService"""
+    class AggregateRequestHandler(BaseHTTPRequestHandler):
+        # Keep-alive so pooled client connections are reused
+        protocol_version = 'HTTP/1.1'
         
-        # Convert Last Updated to datetime
-        if 'Last Updated' in df.columns:
-            df['last_updated'] = pd.to_datetime(df['Last Updated'], errors='coerce')
-            # For apps without valid date, assign a random date in 2018
-            mask = df['last_updated'].isna()
-            df.loc[mask, 'last_updated'] = pd.date_range('2018-01-01', '2018-12-31', periods=mask.sum())
+        def do_GET(self):
+            if self.path == '/summary':
+                self._send(200, json.dumps(service.summary).encode('utf-8'), 'application/json')
+            elif self.path.startswith('/aggregate/') and self.path[len('/aggregate/'):] in CHART_AGGREGATES:
+                try:
+                    payload = service.get(self.path[len('/aggregate/'):])
+                except Exception as e:
+                    self._send(500, str(e).encode('utf-8'), 'text/plain')
+                    return
+                self._send(200, payload, 'application/vnd.apache.arrow.stream')
+            else:
+                self._send(404, b'Not found', 'text/plain')
         
-        return df
+        def _send(self, status, body, content_type):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('X-Dataset-Key', service.dataset_key)
+            self.end_headers()
+            self.wfile.write(body)
+    
+    return AggregateRequestHandler
+
+def serve_aggregates(csv_path, host=AGGREGATE_SERVICE_HOST, port=AGGREGATE_SERVICE_PORT):
+    """Load a CSV and serve its chart aggregates until interrupted"""
+    data = prepare_app_data(read_app_csv(csv_path, list(CHART_COLUMNS)))
+    service = AggregateService(data, f"{os.path.abspath(csv_path)}:{os.path.getmtime(csv_path)}")
+    
+    server = ThreadingHTTPServer((host, port), make_aggregate_handler(service))
+    print(f"Serving aggregates for {len(data)} apps on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+class AggregateServiceError(Exception):
+    """The aggregate service could not be reached or failed a request"""
+
+class AggregateClient:
+    """Fetches chart aggregates from the aggregate service over a pool of keep-alive connections"""
+    
+    def __init__(self, host=AGGREGATE_SERVICE_HOST, port=AGGREGATE_SERVICE_PORT, pool_size=4, timeout=30):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+    
+    def _send(self, conn, path):
+        """GET a path on a connection and return the body, pooling the connection for reuse"""
+        try:
+            conn.request('GET', path)
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            raise
         
-    except Exception as e:
-        st.error(f"Error loading CSV file: {str(e)}")
-        return None
+        if response.status != 200:
+            conn.close()
+            raise AggregateServiceError(f"Aggregate service returned {response.status} for {path}: {body.decode('utf-8', 'replace')}")
+        
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+        return body
+    
+    def _request(self, path):
+        try:
+            return self._send(self._pool.get_nowait(), path)
+        except queue.Empty:
+            pass
+        except (OSError, http.client.HTTPException):
+            # The service may have closed an idle keep-alive connection (e.g. it restarted); retry once
+            pass
+        
+        try:
+            return self._send(http.client.HTTPConnection(self.host, self.port, timeout=self.timeout), path)
+        except (OSError, http.client.HTTPException) as e:
+            raise AggregateServiceError(f"Request for {path} failed: {str(e)}") from e
+    
+    def fetch(self, chart_key):
+        """Aggregate for a chart, or None if nothing passes its filters"""
+        return decode_aggregate(self._request(f'/aggregate/{chart_key}'))
+    
+    def fetch_summary(self):
+        """Summary statistics of the dataset the service holds"""
+        summary = json.loads(self._request('/summary'))
+        summary['shape'] = tuple(summary['shape'])
+        return summary
+
+@st.cache_resource
+def get_aggregate_client(host=AGGREGATE_SERVICE_HOST, port=AGGREGATE_SERVICE_PORT):
+    """One pooled client per dashboard process, shared by all sessions"""
+    return AggregateClient(host, port)
 
 # Main dashboard function
 def main():
@@ -569,14 +1138,19 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
+    # Only the columns the active charts need are read from CSV sources
+    active_chart_keys = get_active_chart_keys()
+    
     # Data source selection
     st.sidebar.header("📂 Data Source")
     data_source = st.sidebar.radio(
         "Choose data source:",
-        ["Sample Data", "Upload Google Play Store CSV", "Use Local File Path"]
+        ["Sample Data", "Upload Google Play Store CSV", "Use Local File Path", "Use Shared Dataset", "Use Aggregate Service"]
     )
     
-    # Load data based on selection
+    # Load data based on selection; CSV sources are parsed and summarized once per file, not per rerun
+    dataset_summary = None
+    aggregate_client = None
     if data_source == "Upload Google Play Store CSV":
         uploaded_file = st.sidebar.file_uploader(
             "Choose the Google Play Store CSV file",
@@ -586,7 +1160,7 @@ def main():
         
         if uploaded_file is not None:
             with st.spinner("Loading Google Play Store CSV data..."):
-                app_data = load_csv_data(uploaded_file)
+                app_data, dataset_summary = ingest_uploaded_csv(uploaded_file.getvalue(), tuple(active_chart_keys))
             if app_data is not None:
                 st.sidebar.success(f"✅ Loaded {len(app_data)} apps from CSV")
             else:
@@ -602,22 +1176,7 @@ def main():
         
         try:
             with st.spinner("Loading data from local file..."):
-                app_data = pd.read_csv(file_path)
-                # Process the data same as upload function
-                if 'Rating' in app_data.columns:
-                    app_data['rating'] = pd.to_numeric(app_data['Rating'], errors='coerce').fillna(0)
-                if 'Reviews' in app_data.columns:
-                    app_data['Reviews'] = pd.to_numeric(app_data['Reviews'], errors='coerce').fillna(0)
-                if 'Size' in app_data.columns:
-                    app_data['size_mb'] = app_data['Size'].apply(parse_size)
-                if 'Installs' in app_data.columns:
-                    app_data['installs_numeric'] = app_data['Installs'].apply(parse_installs)
-                if 'Price' in app_data.columns:
-                    app_data['price_numeric'] = app_data['Price'].apply(parse_price)
-                if 'Last Updated' in app_data.columns:
-                    app_data['last_updated'] = pd.to_datetime(app_data['Last Updated'], errors='coerce')
-                    mask = app_data['last_updated'].isna()
-                    app_data.loc[mask, 'last_updated'] = pd.date_range('2018-01-01', '2018-12-31', periods=mask.sum())[:mask.sum()]
+                app_data, dataset_summary = load_local_csv(file_path, active_chart_keys)
                 
             st.sidebar.success(f"✅ Loaded {len(app_data)} apps from local file")
         except FileNotFoundError:
@@ -627,25 +1186,42 @@ def main():
             st.sidebar.error(f"❌ Error loading file: {str(e)}")
             app_data = generate_sample_data()
     
+    elif data_source == "Use Shared Dataset":
+        try:
+            app_data, dataset_summary = load_shared_dataset()
+            st.sidebar.success(f"✅ Attached to {dataset_summary['total_apps']} apps in shared memory")
+        except FileNotFoundError:
+            st.sidebar.error("❌ No shared dataset published. Run `python app.py publish` first.")
+            app_data = generate_sample_data()
+        except Exception as e:
+            st.sidebar.error(f"❌ Error attaching shared dataset: {str(e)}")
+            app_data = generate_sample_data()
+    
+    elif data_source == "Use Aggregate Service":
+        # The service holds the dataset; this process only renders the aggregates it returns
+        app_data = None
+        try:
+            aggregate_client = get_aggregate_client()
+            dataset_summary = aggregate_client.fetch_summary()
+            st.sidebar.success(f"✅ Connected to aggregate service with {dataset_summary['total_apps']} apps")
+        except Exception as e:
+            st.sidebar.error(f"❌ Aggregate service unavailable ({str(e)}). Run `python app.py serve` first.")
+            aggregate_client = None
+            app_data = generate_sample_data()
+    
     else:
         app_data = generate_sample_data()
     
-    # Time ranges
-    time_ranges = {
-        'chart1': {'start': 15, 'end': 17, 'name': 'Chart 1 (Grouped Bar)', 'time': '3PM-5PM'},
-        'chart2': {'start': 18, 'end': 20, 'name': 'Chart 2 (Category Map)', 'time': '6PM-8PM'},
-        'chart3': {'start': 13, 'end': 14, 'name': 'Chart 3 (Dual-Axis)', 'time': '1PM-2PM'},
-        'chart4': {'start': 18, 'end': 21, 'name': 'Chart 4 (Time Series)', 'time': '6PM-9PM'},
-        'chart5': {'start': 17, 'end': 19, 'name': 'Chart 5 (Bubble Chart)', 'time': '5PM-7PM'},
-        'chart6': {'start': 16, 'end': 18, 'name': 'Chart 6 (Stacked Area)', 'time': '4PM-6PM'}
-    }
+    # Every path that leaves the summary unset fell back to sample data
+    if dataset_summary is None:
+        dataset_summary = summarize_sample_data()
     
     # Display active charts status
     st.markdown('<div class="status-indicator">', unsafe_allow_html=True)
     st.subheader("📊 Active Charts Status:")
     
     cols = st.columns(3)
-    for i, (key, info) in enumerate(time_ranges.items()):
+    for i, (key, info) in enumerate(TIME_RANGES.items()):
         col = cols[i % 3]
         is_active = is_time_in_range(info['start'], info['end'])
         status = "🟢 Active" if is_active else "🔴 Inactive"
@@ -653,60 +1229,76 @@ def main():
     
     st.markdown('</div>', unsafe_allow_html=True)
     
+    # Measuring re-serializes every displayed figure, so it's a debugging opt-in
+    measure_payloads = st.sidebar.checkbox("📦 Measure chart payload sizes", value=False)
+    
     # Display charts based on time
     charts_displayed = False
+    chart_payloads = {}
     
     # Chart 1: 3PM-5PM IST
     if is_time_in_range(15, 17):
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        chart1 = create_chart1_grouped_bar(app_data)
+        chart1 = create_chart1_grouped_bar(app_data, aggregate_client)
         if chart1:
             st.plotly_chart(chart1, use_container_width=True)
+            if measure_payloads:
+                chart_payloads[TIME_RANGES['chart1']['name']] = measure_figure_payload(chart1)
             charts_displayed = True
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Chart 2: 6PM-8PM IST
     if is_time_in_range(18, 20):
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        chart2 = create_chart2_category_map(app_data)
+        chart2 = create_chart2_category_map(app_data, aggregate_client)
         if chart2:
             st.plotly_chart(chart2, use_container_width=True)
+            if measure_payloads:
+                chart_payloads[TIME_RANGES['chart2']['name']] = measure_figure_payload(chart2)
             charts_displayed = True
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Chart 3: 1PM-2PM IST
     if is_time_in_range(13, 14):
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        chart3 = create_chart3_dual_axis(app_data)
+        chart3 = create_chart3_dual_axis(app_data, aggregate_client)
         if chart3:
             st.plotly_chart(chart3, use_container_width=True)
+            if measure_payloads:
+                chart_payloads[TIME_RANGES['chart3']['name']] = measure_figure_payload(chart3)
             charts_displayed = True
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Chart 4: 6PM-9PM IST
     if is_time_in_range(18, 21):
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        chart4 = create_chart4_time_series(app_data)
+        chart4 = create_chart4_time_series(app_data, aggregate_client)
         if chart4:
             st.plotly_chart(chart4, use_container_width=True)
+            if measure_payloads:
+                chart_payloads[TIME_RANGES['chart4']['name']] = measure_figure_payload(chart4)
             charts_displayed = True
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Chart 5: 5PM-7PM IST
     if is_time_in_range(17, 19):
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        chart5 = create_chart5_bubble_chart(app_data)
+        chart5 = create_chart5_bubble_chart(app_data, aggregate_client)
         if chart5:
             st.plotly_chart(chart5, use_container_width=True)
+            if measure_payloads:
+                chart_payloads[TIME_RANGES['chart5']['name']] = measure_figure_payload(chart5)
             charts_displayed = True
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Chart 6: 4PM-6PM IST
     if is_time_in_range(16, 18):
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        chart6 = create_chart6_stacked_area(app_data)
+        chart6 = create_chart6_stacked_area(app_data, aggregate_client)
         if chart6:
             st.plotly_chart(chart6, use_container_width=True)
+            if measure_payloads:
+                chart_payloads[TIME_RANGES['chart6']['name']] = measure_figure_payload(chart6)
             charts_displayed = True
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -741,7 +1333,7 @@ def main():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Total Apps Loaded", len(app_data))
+        st.metric("Total Apps Loaded", dataset_summary['total_apps'])
     
     with col2:
         st.metric("Current IST Hour", f"{current_hour}:00")
@@ -757,23 +1349,47 @@ def main():
         ])
         st.metric("Active Charts", active_charts)
     
+    # Size of the figure spec each displayed chart sends to the browser
+    if chart_payloads:
+        with st.expander("📦 Chart Payload Sizes", expanded=False):
+            for name, payload_bytes in chart_payloads.items():
+                st.write(f"**{name}:** {payload_bytes / 1024:.1f} KB")
+    
     # Display sample data preview if using CSV
     if data_source == "Upload Google Play Store CSV" and app_data is not None:
         with st.expander("📋 Data Preview", expanded=False):
             st.write("**First 5 rows of loaded data:**")
-            st.dataframe(app_data.head())
+            st.dataframe(dataset_summary['preview'])
             
             st.write("**Dataset Info:**")
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.write(f"**Shape:** {app_data.shape}")
+                st.write(f"**Shape:** {dataset_summary['shape']}")
+                st.write(f"**Memory:** {dataset_summary['memory_bytes'] / (1024 * 1024):.1f} MB")
             with col2:
-                if 'Category' in app_data.columns:
-                    st.write(f"**Categories:** {app_data['Category'].nunique()}")
+                if dataset_summary['category_count'] is not None:
+                    st.write(f"**Categories:** {dataset_summary['category_count']}")
             with col3:
-                if 'Type' in app_data.columns:
-                    free_apps = len(app_data[app_data['Type'] == 'Free'])
-                    st.write(f"**Free Apps:** {free_apps}")
+                if dataset_summary['type_counts']:
+                    st.write(f"**Free Apps:** {dataset_summary['type_counts'].get('Free', 0)}")
+                    st.write(f"**Paid Apps:** {dataset_summary['type_counts'].get('Paid', 0)}")
+            
+            null_counts = {col: count for col, count in dataset_summary['null_counts'].items() if count}
+            if null_counts:
+                st.write("**Missing Values:**")
+                st.write(null_counts)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # `python app.py publish [csv_path] [shared_path]` runs the loader for the shared serving mode
+    if len(sys.argv) > 1 and sys.argv[1] == 'publish':
+        csv_path = sys.argv[2] if len(sys.argv) > 2 else "googleplaystore.csv"
+        shared_path = sys.argv[3] if len(sys.argv) > 3 else SHARED_DATASET_PATH
+        summary = publish_shared_dataset(csv_path, shared_path)
+        print(f"Published {summary['total_apps']} apps to {shared_path}")
+    # `python app.py serve [csv_path] [port]` runs the chart aggregate service
+    elif len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        csv_path = sys.argv[2] if len(sys.argv) > 2 else "googleplaystore.csv"
+        port = int(sys.argv[3]) if len(sys.argv) > 3 else AGGREGATE_SERVICE_PORT
+        serve_aggregates(csv_path, port=port)
+    else:
+        main()
\ No newline at end of file
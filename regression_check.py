@@ -0,0 +1,645 @@
+"""Regression harness for the dashboard's optimized code paths
+
+The scalar parsers, row-wise data preparation and in-process chart aggregates in app.py, and
+the dashboard's original figure builders kept below, are the reference; every optimized
+engine must reproduce them exactly on the real CSV and on randomized, adversarial data.
+
+Run with `python regression_check.py [iterations] [seed]`.
+"""
+import base64
+import io
+import json
+import math
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from plotly.subplots import make_subplots
+from plotly.utils import PlotlyJSONEncoder
+
+import app
+from app import (
+    CHART_AGGREGATES,
+    CHART_COLUMNS,
+    AggregateService,
+    AggregateServiceError,
+    arrow_table_to_frame,
+    decode_aggregate,
+    parse_installs,
+    parse_installs_series,
+    parse_price,
+    parse_price_series,
+    parse_size,
+    parse_size_series,
+    prepare_app_data,
+    read_app_csv,
+    translate_categories
+)
+
+# Adversarial inputs
+ADVERSARIAL_VALUES = {
+    'Installs': [None, np.nan, '', 'Free', '0', '1,000+ ', ' 100+', '-5', '1_000', '1e3', '10.0', '١٢٣',
+                 '9223372036854775807+', '+', ',', '1,00,000+', 5, 5.0],
+    'Size': [None, np.nan, '', 'Varies with device', 'varies with device', '1,000+', '19 M', '100', '1e3',
+             '0.5m', '.5M', '5.M', '8.7K', '1.5MB', 'kilobytes 12', 19, 2.5],
+    'Price': [None, np.nan, '', '0', '$', 'Everyone', '$1,000', '-$1', ' 2.5', '0.0', '$0', '$.99', '4.',
+              'NaN', 'inf', '1e2', 0, 1.99],
+    'Rating': [None, np.nan, '', 'NaN', '19', 'abc', '5.0', '-1', '4.1 '],
+    'Reviews': [None, np.nan, '', '3.0M', '-1', '1e5', '2,000'],
+    'Last Updated': [None, np.nan, '', 'February 30, 2018', '2018-05-01', 'Varies with device', '1.0.19',
+                     'January 7, 1899', 'December 31, 2262'],
+    'App': [None, np.nan, '', 'X', 'Zebra', 'Sims 4', 'App 123', 'ÉCOLE', 'apps', '   '],
+    'Category': [None, np.nan, '', 'game', '1.9', 'ÉDUCATION', 'Z'],
+    'Type': [None, np.nan, '0', 'NaN', 'free'],
+    'Content Rating': [None, np.nan, '', 'Everyone 10+', 'Unrated']
+}
+
+# Values that make the reference raise or overflow int64; kept rare so most generated frames load
+RARE_VALUES = {'Size': ['k', '1.2.3M', 'M'], 'Installs': ['99999999999999999999+']}
+
+def _random_value(rng, column):
+    """One well-formed value for a raw Google Play Store column"""
+    if column == 'Installs':
+        installs = rng.choice([0, 1, 5, 10, 100, 1000, 10000, 500000, 1000000, 10**9, rng.randint(0, 10**12)])
+        text = f"{installs:,}" if rng.random() < 0.7 else str(installs)
+        return text + '+' if rng.random() < 0.8 else text
+    if column == 'Size':
+        size = round(rng.uniform(0, 1000), rng.randint(0, 4))
+        return f"{size}{rng.choice(['M', 'M', 'k', 'K', 'm', ''])}"
+    if column == 'Price':
+        return '0' if rng.random() < 0.6 else f"{rng.choice(['$', '$', ''])}{rng.uniform(0, 400):.{rng.randint(0, 3)}f}"
+    if column == 'Rating':
+        return f"{rng.uniform(1, 5):.1f}"
+    if column == 'Reviews':
+        return str(rng.randint(0, 10**7))
+    if column == 'Last Updated':
+        return datetime(rng.randint(2010, 2018), rng.randint(1, 12), rng.randint(1, 28)).strftime('%B %d, %Y')
+    if column == 'App':
+        words = ['Photo', 'Editor', 'Game', 'Chat', 'Xtreme', 'Zen', 'Yoga', 'Map', 'Pro', 'Lite', '2', 'Tube']
+        return ' '.join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+    if column == 'Category':
+        return rng.choice(['GAME', 'BEAUTY', 'BUSINESS', 'COMICS', 'COMMUNICATION', 'DATING', 'ENTERTAINMENT',
+                           'SOCIAL', 'EVENTS', 'EDUCATION', 'TOOLS', 'PRODUCTIVITY', 'PHOTOGRAPHY',
+                           'TRAVEL_AND_LOCAL', 'FAMILY', 'ART_AND_DESIGN'])
+    if column == 'Type':
+        return rng.choice(['Free', 'Free', 'Paid'])
+    return rng.choice(['Everyone', 'Everyone', 'Teen', 'Mature 17+'])
+
+def generate_fuzz_frame(rng, rows, adversarial_rate=0.15, rare_rate=0.0):
+    """Raw dataset mixing well-formed values with adversarial ones"""
+    data = {}
+    for column, adversarial in ADVERSARIAL_VALUES.items():
+        rare = RARE_VALUES.get(column, [])
+        values = []
+        for _ in range(rows):
+            roll = rng.random()
+            if rare and roll < rare_rate:
+                values.append(rng.choice(rare))
+            elif roll < adversarial_rate:
+                values.append(rng.choice(adversarial))
+            else:
+                values.append(_random_value(rng, column))
+        data[column] = pd.Series(values, dtype=object)
+    return pd.DataFrame(data)
+
+def load_fuzz_frame(frame):
+    """Round-trip a generated dataset through CSV and the dashboard's loader, as an upload would"""
+    buffer = io.StringIO()
+    frame.to_csv(buffer, index=False)
+    buffer.seek(0)
+    return read_app_csv(buffer, list(CHART_COLUMNS))
+
+# Reference figure builders
+# The dashboard's chart builders before figure templates and chart aggregates, kept unchanged
+# (apart from naming) as the reference for the figures the dashboard renders
+def reference_chart1_grouped_bar(data):
+    """Chart 1 as originally built: Grouped Bar Chart (3PM-5PM IST)"""
+    filtered_data = app.filter_chart1_data(data)
+    if filtered_data.empty:
+        st.warning("⚠️ No data available after applying filters for Chart 1.")
+        return None
+    
+    # Group by category and calculate stats
+    grouped = filtered_data.groupby('Category').agg({
+        'rating': 'mean',
+        'Reviews': 'sum',
+        'installs_numeric': 'sum'
+    }).reset_index()
+    
+    # Apply translations
+    grouped['Category'] = grouped['Category'].apply(translate_categories)
+    
+    # Get top 10 by installs
+    top_10 = grouped.nlargest(10, 'installs_numeric')
+    
+    # Create dual-axis chart
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    fig.add_trace(
+        go.Bar(x=top_10['Category'], y=top_10['rating'], name="Avg Rating", marker_color='#8884d8'),
+        secondary_y=False,
+    )
+    
+    fig.add_trace(
+        go.Bar(x=top_10['Category'], y=top_10['Reviews'], name="Total Reviews", marker_color='#82ca9d'),
+        secondary_y=True,
+    )
+    
+    fig.update_xaxes(title_text="Categories")
+    fig.update_yaxes(title_text="Average Rating", secondary_y=False)
+    fig.update_yaxes(title_text="Total Reviews", secondary_y=True)
+    
+    fig.update_layout(
+        title="Chart 1: Top 10 Categories - Average Rating vs Total Reviews (3PM-5PM IST)",
+        height=500
+    )
+    
+    return fig
+
+def reference_chart2_category_map(data):
+    """Chart 2 as originally built: Category visualization (6PM-8PM IST)"""
+    filtered_data = app.filter_chart2_data(data)
+    if filtered_data.empty:
+        st.warning("⚠️ No data available after applying filters for Chart 2.")
+        return None
+    
+    # Group by category
+    grouped = filtered_data.groupby('Category').agg({
+        'installs_numeric': 'sum',
+        'rating': 'mean'
+    }).reset_index()
+    
+    # Apply translations
+    grouped['Category'] = grouped['Category'].apply(translate_categories)
+    
+    # Get top 5
+    top_5 = grouped.nlargest(5, 'installs_numeric')
+    
+    # Create bar chart with color coding
+    colors = ['#ff6b6b' if x > 1000000 else '#4ecdc4' for x in top_5['installs_numeric']]
+    
+    fig = go.Figure(data=[
+        go.Bar(x=top_5['Category'], y=top_5['installs_numeric'], marker_color=colors, name="Total Installs")
+    ])
+    
+    fig.update_layout(
+        title="Chart 2: Top 5 Categories by Installs (Filtered) (6PM-8PM IST)",
+        xaxis_title="Categories",
+        yaxis_title="Total Installs",
+        height=500
+    )
+    
+    return fig
+
+def reference_chart3_dual_axis(data):
+    """Chart 3 as originally built: Dual-axis chart (1PM-2PM IST)"""
+    filtered_data = app.filter_chart3_data(data)
+    if filtered_data.empty:
+        st.warning("⚠️ No data available after applying filters for Chart 3.")
+        return None
+    
+    # Separate free and paid apps
+    free_apps = filtered_data[filtered_data['Type'] == 'Free']
+    paid_apps = filtered_data[filtered_data['Type'] == 'Paid']
+    
+    # Group by category
+    free_grouped = free_apps.groupby('Category').agg({'installs_numeric': 'mean', 'Reviews': 'mean'}).reset_index()
+    paid_grouped = paid_apps.groupby('Category').agg({'installs_numeric': 'mean', 'Reviews': 'mean'}).reset_index()
+    
+    # Apply translations
+    free_grouped['Category'] = free_grouped['Category'].apply(translate_categories)
+    paid_grouped['Category'] = paid_grouped['Category'].apply(translate_categories)
+    
+    # Create dual-axis chart
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    if not free_grouped.empty:
+        top_free = free_grouped.head(3)
+        fig.add_trace(
+            go.Bar(x=top_free['Category'], y=top_free['installs_numeric'], name="Free Apps Installs", marker_color='#8884d8'),
+            secondary_y=False,
+        )
+        
+        fig.add_trace(
+            go.Bar(x=top_free['Category'], y=top_free['Reviews'], name="Free Apps Reviews", marker_color='#ffc658'),
+            secondary_y=True,
+        )
+    
+    if not paid_grouped.empty:
+        top_paid = paid_grouped.head(3)
+        fig.add_trace(
+            go.Bar(x=top_paid['Category'], y=top_paid['installs_numeric'], name="Paid Apps Installs", marker_color='#82ca9d'),
+            secondary_y=False,
+        )
+        
+        fig.add_trace(
+            go.Bar(x=top_paid['Category'], y=top_paid['Reviews'], name="Paid Apps Reviews", marker_color='#ff7c7c'),
+            secondary_y=True,
+        )
+    
+    fig.update_xaxes(title_text="Categories")
+    fig.update_yaxes(title_text="Average Installs", secondary_y=False)
+    fig.update_yaxes(title_text="Average Reviews", secondary_y=True)
+    
+    fig.update_layout(
+        title="Chart 3: Free vs Paid Apps - Top 3 Categories (1PM-2PM IST)",
+        height=500
+    )
+    
+    return fig
+
+def reference_chart4_time_series(data):
+    """Chart 4 as originally built: Time Series Line Chart (6PM-9PM IST)"""
+    filtered_data = app.filter_chart4_data(data)
+    if filtered_data.empty:
+        st.warning("⚠️ No data available after applying filters for Chart 4.")
+        return None
+    
+    # Group by month and category
+    filtered_data['month'] = filtered_data['last_updated'].dt.to_period('M').astype(str)
+    grouped = filtered_data.groupby(['month', 'Category'])['installs_numeric'].sum().reset_index()
+    
+    # Apply translations
+    grouped['Category'] = grouped['Category'].apply(translate_categories)
+    
+    # Pivot for plotting
+    pivot_data = grouped.pivot(index='month', columns='Category', values='installs_numeric').fillna(0)
+    
+    fig = go.Figure()
+    
+    colors = ['#8884d8', '#82ca9d', '#ffc658', '#ff7c7c', '#8dd1e1']
+    
+    for i, category in enumerate(pivot_data.columns):
+        fig.add_trace(go.Scatter(
+            x=pivot_data.index,
+            y=pivot_data[category],
+            mode='lines',
+            name=category,
+            line=dict(color=colors[i % len(colors)])
+        ))
+    
+    fig.update_layout(
+        title="Chart 4: Time Series - Installs by Category (6PM-9PM IST)",
+        xaxis_title="Month",
+        yaxis_title="Installs",
+        height=500
+    )
+    
+    return fig
+
+def reference_chart5_bubble_chart(data):
+    """Chart 5 as originally built: Bubble Chart (5PM-7PM IST)"""
+    filtered_data = app.filter_chart5_data(data)
+    if filtered_data.empty:
+        st.warning("⚠️ No data available after applying filters for Chart 5.")
+        return None
+    
+    # Apply translations
+    filtered_data = filtered_data.copy()
+    filtered_data['Category'] = filtered_data['Category'].apply(translate_categories)
+    
+    # Limit for performance
+    sample_data = filtered_data.head(100)
+    
+    # Create colors for Game category (Pink)
+    colors = ['#ff69b4' if cat == 'Games' else '#8884d8' for cat in sample_data['Category']]
+    
+    fig = go.Figure(data=go.Scatter(
+        x=sample_data['size_mb'],
+        y=sample_data['rating'],
+        mode='markers',
+        marker=dict(
+            size=sample_data['installs_numeric']/50000,  # Scale down for visibility
+            color=colors,
+            opacity=0.6,
+            line=dict(width=2, color='DarkSlateGrey')
+        ),
+        text=sample_data['App'],
+        hovertemplate='<b>%{text}</b><br>' +
+                      'Size: %{x} MB<br>' +
+                      'Rating: %{y}<br>' +
+                      'Installs: %{marker.size}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title="Chart 5: Bubble Chart - Size vs Rating vs Installs (5PM-7PM IST)",
+        xaxis_title="Size (MB)",
+        yaxis_title="Rating",
+        height=500
+    )
+    
+    return fig
+
+def reference_chart6_stacked_area(data):
+    """Chart 6 as originally built: Stacked Area Chart (4PM-6PM IST)"""
+    filtered_data = app.filter_chart6_data(data)
+    if filtered_data.empty:
+        st.warning("⚠️ No data available after applying filters for Chart 6.")
+        return None
+    
+    # Group by month and category
+    filtered_data['month'] = filtered_data['last_updated'].dt.to_period('M').astype(str)
+    grouped = filtered_data.groupby(['month', 'Category'])['installs_numeric'].sum().reset_index()
+    
+    # Apply translations
+    grouped['Category'] = grouped['Category'].apply(translate_categories)
+    
+    # Pivot for plotting
+    pivot_data = grouped.pivot(index='month', columns='Category', values='installs_numeric').fillna(0)
+    
+    fig = go.Figure()
+    
+    colors = ['#8884d8', '#82ca9d', '#ffc658', '#ff7c7c', '#8dd1e1']
+    
+    for i, category in enumerate(pivot_data.columns):
+        fig.add_trace(go.Scatter(
+            x=pivot_data.index,
+            y=pivot_data[category],
+            mode='lines',
+            name=category,
+            stackgroup='one',
+            fill='tonexty' if i > 0 else 'tozeroy',
+            line=dict(color=colors[i % len(colors)])
+        ))
+    
+    fig.update_layout(
+        title="Chart 6: Stacked Area - Cumulative Installs (4PM-6PM IST)",
+        xaxis_title="Month",
+        yaxis_title="Cumulative Installs",
+        height=500
+    )
+    
+    return fig
+
+REFERENCE_CHART_BUILDERS = {
+    'chart1': reference_chart1_grouped_bar,
+    'chart2': reference_chart2_category_map,
+    'chart3': reference_chart3_dual_axis,
+    'chart4': reference_chart4_time_series,
+    'chart5': reference_chart5_bubble_chart,
+    'chart6': reference_chart6_stacked_area
+}
+
+# Comparison and bookkeeping
+def _outcome(func, *args):
+    """Result of a call, or the type of the exception it raised"""
+    try:
+        return ('ok', func(*args))
+    except Exception as e:
+        return ('error', type(e))
+
+def _values_match(expected, actual):
+    """Exact equality of two parsed columns, including dtype, index and name"""
+    try:
+        pd.testing.assert_series_equal(expected, actual, check_exact=True)
+    except AssertionError:
+        return False
+    return True
+
+def _frames_identical(expected, actual):
+    """Exact equality of two frames, including dtypes"""
+    try:
+        pd.testing.assert_frame_equal(expected, actual, check_exact=True)
+    except AssertionError:
+        return False
+    return True
+
+def _frames_match(expected, actual):
+    """Exact equality of two frames (or both None), ignoring dtype differences such as object vs Arrow strings"""
+    if expected is None or actual is None:
+        return expected is None and actual is None
+    try:
+        pd.testing.assert_frame_equal(
+            expected, actual,
+            check_dtype=False, check_index_type=False, check_column_type=False, check_exact=True
+        )
+    except AssertionError:
+        return False
+    return True
+
+def _plain_values(value):
+    """Figure spec values with typed arrays decoded, numbers as floats and NaN as None"""
+    if isinstance(value, dict):
+        if 'bdata' in value and 'dtype' in value:
+            decoded = np.frombuffer(base64.b64decode(value['bdata']), dtype=np.dtype(value['dtype']))
+            return [_plain_values(v) for v in decoded.tolist()]
+        return {key: _plain_values(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_plain_values(v) for v in value]
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return None if math.isnan(value) else float(value)
+    return value
+
+def _figure_values(fig):
+    """What a figure sends to the browser, independent of array typing (lists, float64 or compact typed arrays)"""
+    # The stdlib encoder, unlike orjson, accepts the Python ints beyond int64 the scalar parser can yield
+    spec = _plain_values(json.loads(json.dumps(fig.to_plotly_json(), cls=PlotlyJSONEncoder)))
+    for trace in spec.get('data', []):
+        # Templates name the default x axis explicitly; make_subplots and go.Figure leave it implicit
+        trace.setdefault('xaxis', 'x')
+    return spec
+
+def _figures_match(expected, actual):
+    """Both None (chart skipped), or figures plotting the same values with the same layout"""
+    if expected is None or actual is None:
+        return expected is None and actual is None
+    return _figure_values(expected) == _figure_values(actual)
+
+def _outcomes_match(expected, actual, compare):
+    """Both calls raised the same exception type, or both returned results that compare equal"""
+    if expected[0] != actual[0]:
+        return False
+    if expected[0] == 'error':
+        return expected[1] == actual[1]
+    return compare(expected[1], actual[1])
+
+def _timed(func, *args):
+    """Outcome of a call and its wall-clock duration"""
+    start = time.perf_counter()
+    outcome = _outcome(func, *args)
+    return outcome, time.perf_counter() - start
+
+def _stats(results, engine):
+    """Running totals for one engine"""
+    return results.setdefault(engine, {
+        'cases': 0, 'divergences': [], 'unsupported': [], 'reference_seconds': 0.0, 'engine_seconds': 0.0
+    })
+
+def _record(results, engine, case, expected, actual, compare, reference_seconds, engine_seconds):
+    """Add one reference-vs-engine comparison to an engine's totals"""
+    stats = _stats(results, engine)
+    stats['cases'] += 1
+    stats['reference_seconds'] += reference_seconds
+    stats['engine_seconds'] += engine_seconds
+    if not _outcomes_match(expected, actual, compare):
+        stats['divergences'].append(case)
+
+# Engine checks
+PARSER_ENGINES = [
+    ('Installs', parse_installs, parse_installs_series),
+    ('Size', parse_size, parse_size_series),
+    ('Price', parse_price, parse_price_series)
+]
+
+def check_parser_engines(results, frame, case):
+    """Vectorized column parsers against the scalar parsers applied row by row"""
+    for column, reference, engine in PARSER_ENGINES:
+        values = frame[column]
+        expected, reference_seconds = _timed(values.apply, reference)
+        actual, engine_seconds = _timed(engine, values)
+        _record(results, engine.__name__, case, expected, actual, _values_match, reference_seconds, engine_seconds)
+
+def check_parser_values(results):
+    """Every adversarial value on its own, including non-string values a CSV never yields"""
+    for column, reference, engine in PARSER_ENGINES:
+        for value in ADVERSARIAL_VALUES[column] + RARE_VALUES.get(column, []):
+            values = pd.Series([value], dtype=object)
+            # Single values only check correctness; they would swamp the speedup with call overhead
+            _record(results, engine.__name__, f'value:{value!r}', _outcome(values.apply, reference),
+                    _outcome(engine, values), _values_match, 0.0, 0.0)
+
+def check_chart_engines(results, prepared, case):
+    """Chart filters and aggregates on the shared Arrow dataset and through the aggregate service"""
+    import pyarrow as pa
+    
+    service = AggregateService(prepared, case)
+    try:
+        shared = arrow_table_to_frame(pa.Table.from_pandas(prepared, preserve_index=False))
+    except (pa.ArrowException, OverflowError):
+        # Publishing refuses such data loudly (e.g. installs beyond int64) rather than changing it
+        shared = None
+        for engine in ('shared_dataset_filters', 'shared_dataset_aggregates'):
+            _stats(results, engine)['unsupported'].append(case)
+    
+    for chart_key, aggregate in CHART_AGGREGATES.items():
+        expected, reference_seconds = _timed(aggregate, prepared)
+        
+        if shared is not None:
+            reference_filter = getattr(app, f'filter_{chart_key}_data')
+            filtered, filter_seconds = _timed(lambda: list(reference_filter(prepared).index))
+            actual, engine_seconds = _timed(lambda: list(reference_filter(shared).index))
+            _record(results, 'shared_dataset_filters', f'{case}/{chart_key}', filtered, actual,
+                    lambda a, b: a == b, filter_seconds, engine_seconds)
+            
+            actual, engine_seconds = _timed(aggregate, shared)
+            _record(results, 'shared_dataset_aggregates', f'{case}/{chart_key}', expected, actual,
+                    _frames_match, reference_seconds, engine_seconds)
+        
+        actual, engine_seconds = _timed(lambda: decode_aggregate(service.get(chart_key)))
+        if actual[0] == 'error' and issubclass(actual[1], (pa.ArrowException, OverflowError)):
+            _stats(results, 'aggregate_service')['unsupported'].append(f'{case}/{chart_key}')
+        else:
+            _record(results, 'aggregate_service', f'{case}/{chart_key}', expected, actual,
+                    _frames_match, reference_seconds, engine_seconds)
+
+CHART_BUILDERS = {
+    'chart1': app.create_chart1_grouped_bar,
+    'chart2': app.create_chart2_category_map,
+    'chart3': app.create_chart3_dual_axis,
+    'chart4': app.create_chart4_time_series,
+    'chart5': app.create_chart5_bubble_chart,
+    'chart6': app.create_chart6_stacked_area
+}
+
+class StubAggregateClient:
+    """Answers like the aggregate service with aggregates computed in-process (the wire format is checked above)"""
+    
+    def __init__(self, data):
+        self.data = data
+    
+    def fetch(self, chart_key):
+        return CHART_AGGREGATES[chart_key](self.data)
+
+class FailingAggregateClient:
+    """Fails every request, like a client whose service is down"""
+    
+    def fetch(self, chart_key):
+        raise AggregateServiceError(f"Request for /aggregate/{chart_key} failed: stub failure")
+
+def check_chart_figures(results, prepared, case):
+    """Dashboard figures, built in-process and from aggregate client responses, against the original builders"""
+    stub = StubAggregateClient(prepared)
+    failing = FailingAggregateClient()
+    for chart_key, create_chart in CHART_BUILDERS.items():
+        expected, reference_seconds = _timed(REFERENCE_CHART_BUILDERS[chart_key], prepared)
+        
+        actual, engine_seconds = _timed(create_chart, prepared)
+        _record(results, 'chart_figures', f'{case}/{chart_key}', expected, actual,
+                _figures_match, reference_seconds, engine_seconds)
+        
+        # Charts never touch the frame when a client is given
+        actual, engine_seconds = _timed(create_chart, None, stub)
+        _record(results, 'aggregate_client_figures', f'{case}/{chart_key}', expected, actual,
+                _figures_match, reference_seconds, engine_seconds)
+        
+        # A failing service skips the chart with a warning instead of raising out of the dashboard;
+        # there is no reference to time this against, so it is reported without a speedup
+        _record(results, 'aggregate_client_failures', f'{case}/{chart_key}', ('ok', None),
+                _outcome(create_chart, None, failing), _figures_match, 0.0, 0.0)
+
+# Runner
+def run_regression_harness(iterations=20, rows=4000, seed=0, csv_path="googleplaystore.csv"):
+    """Check every optimized engine against the reference on randomized data (and the real CSV if present)"""
+    try:
+        import pyarrow  # noqa: F401
+        has_arrow = True
+    except ImportError:
+        has_arrow = False
+    
+    cases = []
+    if os.path.exists(csv_path):
+        cases.append((f'csv:{csv_path}', read_app_csv(csv_path, list(CHART_COLUMNS))))
+    for i in range(iterations):
+        rng = random.Random(seed + i)
+        # About two rare values per column, so some of these frames still load
+        rare_rate = 2 / rows if i % 4 == 3 else 0.0
+        cases.append((f'seed:{seed + i}', load_fuzz_frame(generate_fuzz_frame(rng, rows, rare_rate=rare_rate))))
+    
+    results = {}
+    check_parser_values(results)
+    for case, frame in cases:
+        check_parser_engines(results, frame, case)
+        
+        expected, reference_seconds = _timed(prepare_app_data, frame.copy(), False)
+        actual, engine_seconds = _timed(prepare_app_data, frame.copy())
+        _record(results, 'prepare_app_data', case, expected, actual, _frames_identical, reference_seconds, engine_seconds)
+        
+        if expected[0] == 'ok':
+            check_chart_figures(results, expected[1], case)
+        if has_arrow and expected[0] == 'ok':
+            check_chart_engines(results, expected[1], case)
+    
+    return results
+
+def print_regression_report(results):
+    """Print divergences and speedups per engine; returns True when every engine matched the reference"""
+    all_match = True
+    for engine, stats in results.items():
+        if stats['engine_seconds']:
+            timing = f"{stats['reference_seconds'] / stats['engine_seconds']:6.2f}x vs reference"
+        else:
+            timing = "  consistency check, not timed"
+        status = "OK" if not stats['divergences'] else f"DIVERGED in {len(stats['divergences'])}"
+        print(f"{engine:28} {stats['cases']:5} cases  {status:16} {timing}")
+        for case in stats['divergences'][:5]:
+            print(f"    diverged on {case}")
+        if stats['unsupported']:
+            print(f"    refused {len(stats['unsupported'])} unsupported datasets, e.g. {stats['unsupported'][0]}")
+        all_match = all_match and not stats['divergences']
+    return all_match
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("pyarrow not installed: shared dataset and aggregate service checks are skipped")
+    if not print_regression_report(run_regression_harness(iterations, seed=seed)):
+        sys.exit(1)